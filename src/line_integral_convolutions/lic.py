@@ -8,191 +8,372 @@
 ## ###############################################################
 import numpy as np
 
-from numba import njit, prange
-
-from . import utils
+from numba import guvectorize, njit
 
+from . import lic_cuda, utils
 
 ## ###############################################################
 ## LIC IMPLEMENTATION
 ## ###############################################################
-@njit
-def taper_pixel_contribution(streamlength: int, step_index: int) -> float:
-    """
-    Computes a weight for the decreasing contribution of a pixel based on its distance along a streamline.
+## relax IEEE rules for speed, but keep inf/nan semantics: `delta_time_*` can legitimately be inf
+FASTMATH_FLAGS = {"nsz", "arcp", "contract", "afn", "reassoc"}
 
-    Parameters:
-    -----------
-    streamlength : int
-        Maximum length of a streamline.
+## edge length (in pixels) of the square tiles that the output image is processed in
+TILE_SIZE = 32
 
-    step_index : int
-        Index of the current step along the streamline.
-
-    Returns:
-    --------
-    float
-        Weighting value bound between 0 and 1.
-    """
-    return 0.5 * (1 + np.cos(np.pi * step_index / streamlength))
+## number of streamlines that are advected together, in lockstep
+NUM_LANES = 8
 
 
-@njit
+@njit(
+    "float32(float32[:, ::1], float32, float32, int64, int64)",
+    fastmath=FASTMATH_FLAGS,
+    boundscheck=False,
+    error_model="numpy",
+    cache=True,
+)
 def interpolate_bilinear(
-    vfield: np.ndarray, row: float, col: float
-) -> tuple[float, float]:
+    sfield: np.ndarray, row: float, col: float, num_rows: int, num_cols: int
+) -> float:
     """
-    Bilinear interpolation on the vector field at a non-integer position (row, col).
+    Bilinear interpolation on a 2D field with shape (num_rows, num_cols) at a non-integer position (row, col). The shape is passed in by the caller, so it is read once per walk rather than once per sample.
     """
-    row_low = int(np.floor(row))
-    col_low = int(np.floor(col))
-    row_high = min(row_low + 1, vfield.shape[1] - 1)
-    col_high = min(col_low + 1, vfield.shape[2] - 1)
+    ## positions are never negative, so truncation gives the same result as (the far slower) floor
+    row_low = int(row)
+    col_low = int(col)
+    row_high = min(row_low + 1, num_rows - 1)
+    col_high = min(col_low + 1, num_cols - 1)
     ## weight based on distance from pixel edge
-    weight_row_high = row - row_low
-    weight_col_high = col - col_low
-    weight_row_low = 1 - weight_row_high
-    weight_col_low = 1 - weight_col_high
-    interpolated_vfield_comp_col = (
-        vfield[0, row_low, col_low] * weight_row_low * weight_col_low
-        + vfield[0, row_low, col_high] * weight_row_low * weight_col_high
-        + vfield[0, row_high, col_low] * weight_row_high * weight_col_low
-        + vfield[0, row_high, col_high] * weight_row_high * weight_col_high
-    )
-    interpolated_vfield_comp_row = (
-        vfield[1, row_low, col_low] * weight_row_low * weight_col_low
-        + vfield[1, row_low, col_high] * weight_row_low * weight_col_high
-        + vfield[1, row_high, col_low] * weight_row_high * weight_col_low
-        + vfield[1, row_high, col_high] * weight_row_high * weight_col_high
+    weight_row_high = row - np.float32(row_low)
+    weight_col_high = col - np.float32(col_low)
+    weight_row_low = np.float32(1.0) - weight_row_high
+    weight_col_low = np.float32(1.0) - weight_col_high
+    return (
+        sfield[row_low, col_low] * weight_row_low * weight_col_low
+        + sfield[row_low, col_high] * weight_row_low * weight_col_high
+        + sfield[row_high, col_low] * weight_row_high * weight_col_low
+        + sfield[row_high, col_high] * weight_row_high * weight_col_high
     )
-    ## remember (x,y) -> (col, row)
-    return interpolated_vfield_comp_col, interpolated_vfield_comp_row
 
 
-@njit
-def advect_streamline(
-    vfield: np.ndarray,
+## note: `inline="always"` splices the body into each caller at the Numba-IR level, so when a caller passes
+## `bool_periodic_BCs` as a literal, the boundary-condition branch is resolved at compile time
+@njit(
+    inline="always",
+    fastmath=FASTMATH_FLAGS,
+    boundscheck=False,
+    error_model="numpy",
+)
+def advect_streamlines(
+    vfield_x: np.ndarray,
+    vfield_y: np.ndarray,
     sfield_in: np.ndarray,
-    start_row: int,
-    start_col: int,
+    start_rows: np.ndarray,
+    start_cols: np.ndarray,
+    start_vfield_x: np.ndarray,
+    start_vfield_y: np.ndarray,
+    start_sfield: np.ndarray,
     dir_sgn: int,
-    streamlength: int,
     bool_periodic_BCs: bool,
-) -> tuple[float, float]:
+    weights: np.ndarray,
+    weighted_sums: np.ndarray,
+    total_weights: np.ndarray,
+    rows_float: np.ndarray,
+    cols_float: np.ndarray,
+    is_advecting: np.ndarray,
+    num_rows: int,
+    num_cols: int,
+) -> None:
     """
-    Computes the intensity of a pixel (start_row, start_col) by summing the weighted contributions of pixels along a streamline stemming from it.
+    Advects a batch of NUM_LANES streamlines in lockstep, one from each pixel (start_rows[lane], start_cols[lane]), and adds the weighted contributions of the pixels along them to `weighted_sums` and `total_weights`.
 
-    Returns:
-    --------
-    tuple
-        A tuple containing:
-        - weighted_sum : float
-            The weighted sum of intensity values along the streamline.
-        - total_weight : float
-            The total weight accumulated from the taper function along the streamline.
+    Each lane is an independent streamline, so the per-lane work within a step has no dependencies, and the compiler can overlap (or vectorise) it across lanes. Instead of breaking out of the walk, a lane that halts (zero field magnitude) or leaves an open domain is masked out via `is_advecting`, and the walk ends once every lane has stopped.
+
+    `start_vfield_x`, `start_vfield_y` and `start_sfield` hold the fields sampled at each seed pixel, which stand in for the first step's interpolations. `rows_float`, `cols_float` and `is_advecting` are scratch buffers of length NUM_LANES, and (num_rows, num_cols) is the shape shared by all of the fields.
     """
-    weighted_sum = 0.0
-    total_weight = 0.0
-    row_float, col_float = start_row, start_col
-    num_rows, num_cols = vfield.shape[1], vfield.shape[2]
-    for step in range(streamlength):
-        row_int = int(np.floor(row_float))
-        col_int = int(np.floor(col_float))
-        # ## nearest neighbor interpolation
-        # vfield_comp_col = dir_sgn * vfield[0, row_int, col_int]  # x
-        # vfield_comp_row = dir_sgn * vfield[1, row_int, col_int]  # y
-        ## bilinear interpolation (negligble performance hit compared to nearest neighbor)
-        vfield_comp_col, vfield_comp_row = interpolate_bilinear(
-            vfield=vfield,
-            row=row_float,
-            col=col_float,
-        )
-        vfield_comp_col *= dir_sgn
-        vfield_comp_row *= dir_sgn
-        ## skip if the field magnitude is zero: advection has halted
-        if abs(vfield_comp_row) == 0.0 and abs(vfield_comp_col) == 0.0:
+    ## keep all of the streamline state in single precision: mixing in float64 literals would promote every operation
+    zero = np.float32(0.0)
+    one = np.float32(1.0)
+    infinity = np.float32(np.inf)
+    sgn_float = np.float32(dir_sgn)
+    num_rows_float, num_cols_float = np.float32(num_rows), np.float32(num_cols)
+    for lane in range(NUM_LANES):
+        rows_float[lane] = np.float32(start_rows[lane])
+        cols_float[lane] = np.float32(start_cols[lane])
+        is_advecting[lane] = True
+    for step in range(weights.shape[0]):
+        num_advecting = 0
+        for lane in range(NUM_LANES):
+            row_float = rows_float[lane]
+            col_float = cols_float[lane]
+            ## remember (x,y) -> (col, row)
+            if step == 0:
+                ## every walk from a pixel starts with the same samples, so reuse the ones taken at the seed
+                vfield_comp_col = sgn_float * start_vfield_x[lane]
+                vfield_comp_row = sgn_float * start_vfield_y[lane]
+                sfield_value = start_sfield[lane]
+            else:
+                ## bilinear interpolation (negligble performance hit compared to nearest neighbor)
+                vfield_comp_col = sgn_float * interpolate_bilinear(
+                    sfield=vfield_x,
+                    row=row_float,
+                    col=col_float,
+                    num_rows=num_rows,
+                    num_cols=num_cols,
+                )
+                vfield_comp_row = sgn_float * interpolate_bilinear(
+                    sfield=vfield_y,
+                    row=row_float,
+                    col=col_float,
+                    num_rows=num_rows,
+                    num_cols=num_cols,
+                )
+                sfield_value = interpolate_bilinear(
+                    sfield=sfield_in,
+                    row=row_float,
+                    col=col_float,
+                    num_rows=num_rows,
+                    num_cols=num_cols,
+                )
+            ## stop advecting if the field magnitude is zero: advection has halted
+            bool_advecting = is_advecting[lane] and not (
+                vfield_comp_row == zero and vfield_comp_col == zero
+            )
+            ## compute how long the streamline advects before it leaves the current cell region (divided by cell-centers)
+            ## note: these are written as selects rather than if/else blocks, so the step compiles without unpredictable branches
+            ## the next edge is the cell's upper edge when moving forwards, and its lower edge otherwise (or the one
+            ## below that, if the streamline already sits on the lower edge). positions are never negative, so
+            ## truncation gives the lower edge without calling floor/ceil
+            row_low = np.float32(int(row_float))
+            col_low = np.float32(int(col_float))
+            row_edge = (
+                row_low + one
+                if vfield_comp_row > zero
+                else (row_low - one if row_float == row_low else row_low)
+            )
+            col_edge = (
+                col_low + one
+                if vfield_comp_col > zero
+                else (col_low - one if col_float == col_low else col_low)
+            )
+            delta_time_row = (
+                (row_edge - row_float) / vfield_comp_row
+                if vfield_comp_row != zero
+                else infinity
+            )
+            delta_time_col = (
+                (col_edge - col_float) / vfield_comp_col
+                if vfield_comp_col != zero
+                else infinity
+            )
+            ## equivelant to a CFL condition
+            time_step = min(delta_time_col, delta_time_row)
+            ## advect the streamline to the next cell region: land exactly on the crossed edge, so rounding errors cannot stall the streamline
+            row_float_next = (
+                row_edge
+                if delta_time_row == time_step
+                else row_float + vfield_comp_row * time_step
+            )
+            col_float_next = (
+                col_edge
+                if delta_time_col == time_step
+                else col_float + vfield_comp_col * time_step
+            )
+            if bool_periodic_BCs:
+                ## streamlines advance at most one cell per step, so a single shift wraps them back into the domain
+                ## note: the checks are sequential (not if/elif), because a position just below zero can round up onto the upper edge
+                if row_float_next < zero:
+                    row_float_next += num_rows_float
+                if row_float_next >= num_rows_float:
+                    row_float_next -= num_rows_float
+                if col_float_next < zero:
+                    col_float_next += num_cols_float
+                if col_float_next >= num_cols_float:
+                    col_float_next -= num_cols_float
+            else:
+                ## open boundaries: stop advecting if streamline leaves the domain
+                bool_advecting = (
+                    bool_advecting
+                    and (zero <= row_float_next < num_rows_float)
+                    and (zero <= col_float_next < num_cols_float)
+                )
+            ## halted lanes keep their position, so they never sample outside of the domain
+            rows_float[lane] = row_float_next if bool_advecting else row_float
+            cols_float[lane] = col_float_next if bool_advecting else col_float
+            is_advecting[lane] = bool_advecting
+            num_advecting += bool_advecting
+            ## weight the contribution of the current pixel based on its distance from the start of the streamline
+            contribution_weight = weights[step] if bool_advecting else zero
+            weighted_sums[lane] += contribution_weight * sfield_value
+            total_weights[lane] += contribution_weight
+        if num_advecting == 0:
             break
-        ## compute how long the streamline advects before it leaves the current cell region (divided by cell-centers)
-        if vfield_comp_row > 0.0:
-            delta_time_row = (np.floor(row_float) + 1 - row_float) / vfield_comp_row
-        elif vfield_comp_row < 0.0:
-            delta_time_row = (np.ceil(row_float) - 1 - row_float) / vfield_comp_row
-        else:
-            delta_time_row = np.inf
-        if vfield_comp_col > 0.0:
-            delta_time_col = (np.floor(col_float) + 1 - col_float) / vfield_comp_col
-        elif vfield_comp_col < 0.0:
-            delta_time_col = (np.ceil(col_float) - 1 - col_float) / vfield_comp_col
-        else:
-            delta_time_col = np.inf
-        ## equivelant to a CFL condition
-        time_step = min(delta_time_col, delta_time_row)
-        ## advect the streamline to the next cell region
-        col_float += vfield_comp_col * time_step
-        row_float += vfield_comp_row * time_step
-        if bool_periodic_BCs:
-            row_float = (row_float + num_rows) % num_rows
-            col_float = (col_float + num_cols) % num_cols
+
+
+@njit(
+    inline="always",
+    fastmath=FASTMATH_FLAGS,
+    boundscheck=False,
+    error_model="numpy",
+)
+def _compute_lic_lanes(
+    vfield_x: np.ndarray,
+    vfield_y: np.ndarray,
+    sfield_in: np.ndarray,
+    start_rows: np.ndarray,
+    start_cols: np.ndarray,
+    bool_periodic_BCs: bool,
+    weights: np.ndarray,
+    sfield_out: np.ndarray,
+) -> None:
+    """
+    Computes the Line Integral Convolution (LIC) of a batch of NUM_LANES pixels by advecting streamlines from each of them in both forward and backward directions along the vector field.
+
+    Both walks start from the same pixel, so the fields are sampled there once and shared between them.
+    """
+    weighted_sums = np.zeros(NUM_LANES, dtype=np.float32)
+    total_weights = np.zeros(NUM_LANES, dtype=np.float32)
+    rows_float = np.empty(NUM_LANES, dtype=np.float32)
+    cols_float = np.empty(NUM_LANES, dtype=np.float32)
+    is_advecting = np.empty(NUM_LANES, dtype=np.bool_)
+    ## read the domain shape once, and hand it down to every walk
+    num_rows, num_cols = vfield_x.shape
+    ## seeds sit on pixel centres, where bilinear interpolation reduces to reading the pixel itself
+    start_vfield_x = np.empty(NUM_LANES, dtype=np.float32)
+    start_vfield_y = np.empty(NUM_LANES, dtype=np.float32)
+    start_sfield = np.empty(NUM_LANES, dtype=np.float32)
+    for lane in range(NUM_LANES):
+        start_vfield_x[lane] = vfield_x[start_rows[lane], start_cols[lane]]
+        start_vfield_y[lane] = vfield_y[start_rows[lane], start_cols[lane]]
+        start_sfield[lane] = sfield_in[start_rows[lane], start_cols[lane]]
+    for dir_sgn in (+1, -1):
+        advect_streamlines(
+            vfield_x=vfield_x,
+            vfield_y=vfield_y,
+            sfield_in=sfield_in,
+            start_rows=start_rows,
+            start_cols=start_cols,
+            start_vfield_x=start_vfield_x,
+            start_vfield_y=start_vfield_y,
+            start_sfield=start_sfield,
+            dir_sgn=dir_sgn,
+            bool_periodic_BCs=bool_periodic_BCs,
+            weights=weights,
+            weighted_sums=weighted_sums,
+            total_weights=total_weights,
+            rows_float=rows_float,
+            cols_float=cols_float,
+            is_advecting=is_advecting,
+            num_rows=num_rows,
+            num_cols=num_cols,
+        )
+    zero = np.float32(0.0)
+    for lane in range(NUM_LANES):
+        if total_weights[lane] > zero:
+            sfield_out[lane] = weighted_sums[lane] / total_weights[lane]
         else:
-            ## open boundaries: terminate if streamline leaves the domain
-            if not ((0 <= row_float < num_rows) and (0 <= col_float < num_cols)):
-                break
-        ## weight the contribution of the current pixel based on its distance from the start of the streamline
-        contribution_weight = taper_pixel_contribution(streamlength, step)
-        weighted_sum += contribution_weight * sfield_in[row_int, col_int]
-        total_weight += contribution_weight
-    return weighted_sum, total_weight
-
-
-@njit(parallel=True)
-def _compute_lic(
-    vfield: np.ndarray,
+            sfield_out[lane] = zero
+
+
+## note: the LIC is evaluated as a generalised ufunc over batches of NUM_LANES seed pixels: Numba's parallel target
+## splits the batches into contiguous chunks across threads, while the (h,w) fields are broadcast to every batch
+## without being copied
+@guvectorize(
+    [
+        "void(float32[:, ::1], float32[:, ::1], float32[:, ::1], int32[:], int32[:], float32[::1], float32[:])"
+    ],
+    "(h,w),(h,w),(h,w),(l),(l),(s)->(l)",
+    nopython=True,
+    target="parallel",
+    fastmath=FASTMATH_FLAGS,
+    cache=True,
+)
+def _compute_lic_periodic(
+    vfield_x: np.ndarray,
+    vfield_y: np.ndarray,
     sfield_in: np.ndarray,
+    start_rows: np.ndarray,
+    start_cols: np.ndarray,
+    weights: np.ndarray,
     sfield_out: np.ndarray,
-    streamlength: int,
-    num_rows: int,
-    num_cols: int,
-    bool_periodic_BCs: bool,
-) -> np.ndarray:
+) -> None:
     """
-    Computes the Line Integral Convolution (LIC) over the entire domain by advecting streamlines from each pixel in both forward and backward directions along the vector field.
+    `_compute_lic_lanes` specialised for periodic boundary conditions.
     """
-    for row in prange(num_rows):
-        for col in range(num_cols):
-            forward_sum, forward_total = advect_streamline(
-                vfield=vfield,
-                sfield_in=sfield_in,
-                start_row=row,
-                start_col=col,
-                dir_sgn=+1,
-                streamlength=streamlength,
-                bool_periodic_BCs=bool_periodic_BCs,
-            )
-            backward_sum, backward_total = advect_streamline(
-                vfield=vfield,
-                sfield_in=sfield_in,
-                start_row=row,
-                start_col=col,
-                dir_sgn=-1,
-                streamlength=streamlength,
-                bool_periodic_BCs=bool_periodic_BCs,
-            )
-            total_sum = forward_sum + backward_sum
-            total_weight = forward_total + backward_total
-            if total_weight > 0.0:
-                sfield_out[row, col] = total_sum / total_weight
-            else:
-                sfield_out[row, col] = 0.0
-    return sfield_out
+    _compute_lic_lanes(
+        vfield_x=vfield_x,
+        vfield_y=vfield_y,
+        sfield_in=sfield_in,
+        start_rows=start_rows,
+        start_cols=start_cols,
+        bool_periodic_BCs=True,
+        weights=weights,
+        sfield_out=sfield_out,
+    )
+
+
+@guvectorize(
+    [
+        "void(float32[:, ::1], float32[:, ::1], float32[:, ::1], int32[:], int32[:], float32[::1], float32[:])"
+    ],
+    "(h,w),(h,w),(h,w),(l),(l),(s)->(l)",
+    nopython=True,
+    target="parallel",
+    fastmath=FASTMATH_FLAGS,
+    cache=True,
+)
+def _compute_lic_open(
+    vfield_x: np.ndarray,
+    vfield_y: np.ndarray,
+    sfield_in: np.ndarray,
+    start_rows: np.ndarray,
+    start_cols: np.ndarray,
+    weights: np.ndarray,
+    sfield_out: np.ndarray,
+) -> None:
+    """
+    `_compute_lic_lanes` specialised for open boundary conditions.
+    """
+    _compute_lic_lanes(
+        vfield_x=vfield_x,
+        vfield_y=vfield_y,
+        sfield_in=sfield_in,
+        start_rows=start_rows,
+        start_cols=start_cols,
+        bool_periodic_BCs=False,
+        weights=weights,
+        sfield_out=sfield_out,
+    )
+
+
+@njit("UniTuple(int32[::1], 2)(int64, int64)", cache=True)
+def _order_seeds_by_tile(num_rows: int, num_cols: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Lists the (row, col) indices of every pixel, grouped into TILE_SIZE x TILE_SIZE tiles. The indices are stored as int32, which halves the memory streamed in by the seed batches.
+    """
+    seed_rows = np.empty(num_rows * num_cols, dtype=np.int32)
+    seed_cols = np.empty(num_rows * num_cols, dtype=np.int32)
+    seed_index = 0
+    for tile_row_start in range(0, num_rows, TILE_SIZE):
+        for tile_col_start in range(0, num_cols, TILE_SIZE):
+            for row in range(tile_row_start, min(tile_row_start + TILE_SIZE, num_rows)):
+                for col in range(
+                    tile_col_start, min(tile_col_start + TILE_SIZE, num_cols)
+                ):
+                    seed_rows[seed_index] = row
+                    seed_cols[seed_index] = col
+                    seed_index += 1
+    return seed_rows, seed_cols
 
 
-@utils.time_func
 def compute_lic(
     vfield: np.ndarray,
     sfield_in: np.ndarray = None,
     streamlength: int = None,
     seed_sfield: int = 42,
     bool_periodic_BCs: bool = True,
+    bool_use_cuda: bool = False,
+    filter_sigma: float = None,
 ) -> np.ndarray:
     """
     Computes the Line Integral Convolution (LIC) for a given vector field.
@@ -218,6 +399,12 @@ def compute_lic(
     bool_periodic_BCs : bool, optional, default=True
         If True, periodic boundary conditions are applied; otherwise, uses open boundary conditions.
 
+    bool_use_cuda : bool, optional, default=False
+        If True, the LIC is computed on a CUDA-capable GPU (one thread per pixel); otherwise, it runs in parallel on the CPU.
+
+    filter_sigma : float, optional, default=None
+        If provided, a Gaussian high-pass filter with this standard deviation is applied to the LIC image in place, before it is returned (see `utils.filter_highpass_inplace`). A non-positive value leaves nothing after the high-pass, so the image is zeroed.
+
     Returns:
     --------
     np.ndarray
@@ -238,17 +425,65 @@ def compute_lic(
             f"sfield_in must have dimensions ({num_rows}, {num_cols}), "
             f"but received it with dimensions {sfield_in.shape}."
         )
+        ## the compiled kernel only accepts C-contiguous float32 arrays
+        sfield_in = np.ascontiguousarray(sfield_in, dtype=np.float32)
     if streamlength is None:
         streamlength = min(num_rows, num_cols) // 4
-    return _compute_lic(
-        vfield=vfield,
-        sfield_in=sfield_in,
-        sfield_out=sfield_out,
-        streamlength=streamlength,
-        num_rows=num_rows,
-        num_cols=num_cols,
-        bool_periodic_BCs=bool_periodic_BCs,
+    ## taper the contribution of pixels based on their distance along the streamline (bound between 0 and 1)
+    weights = 0.5 * (1 + np.cos(np.pi * np.arange(streamlength) / streamlength))
+    weights = weights.astype(np.float32)
+    ## store each vector component contiguously so the streamline walk reads both from nearby memory
+    vfield_x = np.ascontiguousarray(vfield[0], dtype=np.float32)
+    vfield_y = np.ascontiguousarray(vfield[1], dtype=np.float32)
+    if bool_use_cuda:
+        sfield_out = lic_cuda.compute_lic_cuda(
+            vfield_x=vfield_x,
+            vfield_y=vfield_y,
+            sfield_in=sfield_in,
+            weights=weights,
+            bool_periodic_BCs=bool_periodic_BCs,
+        )
+        if filter_sigma is not None:
+            utils.filter_highpass_inplace(sfield_out, filter_sigma)
+        return sfield_out
+    ## neighbouring pixels trace overlapping streamlines, so seed them tile-by-tile: each thread then works on whole
+    ## tiles, and its reads of the vector and scalar fields stay within a neighbourhood that fits in cache
+    seed_rows, seed_cols = _order_seeds_by_tile(num_rows, num_cols)
+    ## streamlines seeded where the flow is stationary halt at their first step, and those pixels stay zero, so only
+    ## seed pixels with a nonzero velocity: stationary regions then cost no kernel work at all
+    bool_flowing = (vfield_x[seed_rows, seed_cols] != 0) | (
+        vfield_y[seed_rows, seed_cols] != 0
     )
+    seed_rows = seed_rows[bool_flowing]
+    seed_cols = seed_cols[bool_flowing]
+    ## dispatch once to a kernel compiled for the requested boundary conditions
+    if bool_periodic_BCs:
+        _compute_lic_kernel = _compute_lic_periodic
+    else:
+        _compute_lic_kernel = _compute_lic_open
+    ## pad the seeds (by repeating the last one) so they split evenly into batches of NUM_LANES
+    num_seeds = seed_rows.shape[0]
+    if num_seeds > 0:
+        num_padded_seeds = ((num_seeds + NUM_LANES - 1) // NUM_LANES) * NUM_LANES
+        seed_rows = np.pad(seed_rows, (0, num_padded_seeds - num_seeds), mode="edge")
+        seed_cols = np.pad(seed_cols, (0, num_padded_seeds - num_seeds), mode="edge")
+        sfield_lic = _compute_lic_kernel(
+            vfield_x,
+            vfield_y,
+            sfield_in,
+            seed_rows.reshape(-1, NUM_LANES),
+            seed_cols.reshape(-1, NUM_LANES),
+            weights,
+        )
+        sfield_out[seed_rows, seed_cols] = sfield_lic.ravel()
+    ## filter the LIC image where it is, rather than in a separate (allocating) postprocessing step
+    if filter_sigma is not None:
+        utils.filter_highpass_inplace(sfield_out, filter_sigma)
+    return sfield_out
+
+
+## `compute_lic` that also reports how long it took: intended for scripts, so the library call itself stays unwrapped
+compute_lic_timed = utils.time_func(compute_lic)
 
 
 def compute_lic_with_postprocessing(
@@ -262,6 +497,7 @@ def compute_lic_with_postprocessing(
     bool_filter: bool = True,
     filter_sigma: float = 3.0,
     bool_equalize: bool = True,
+    bool_use_cuda: bool = False,
 ) -> np.ndarray:
     """
     Iteratively computes the Line Integral Convolutions (LICs) for a given vector field with optional postprocessing steps (i.e., filtering and intensity binning). See the `compute_lic` function for more details on the core LIC computation.
@@ -298,23 +534,33 @@ def compute_lic_with_postprocessing(
     bool_equalize : bool, optional, default=True
         If True, applies an intensity binning equalization at the end of the routine.
 
+    bool_use_cuda : bool, optional, default=False
+        If True, the LIC is computed on a CUDA-capable GPU; otherwise, it runs in parallel on the CPU.
+
     Returns:
     --------
     np.ndarray
         The post-processed LIC image.
     """
-    for _ in range(num_repetitions):
-        for _ in range(num_iterations):
+    for repetition_index in range(num_repetitions):
+        for iteration_index in range(num_iterations):
+            ## each repetition continues from the unfiltered LIC of the previous one, so only the high-pass of the final
+            ## LIC reaches the output: have that LIC apply the filter (in place) as part of computing it
+            bool_last_iteration = (repetition_index == num_repetitions - 1) and (
+                iteration_index == num_iterations - 1
+            )
             sfield = compute_lic(
                 vfield=vfield,
                 sfield_in=sfield_in,
                 streamlength=streamlength,
                 seed_sfield=seed_sfield,
                 bool_periodic_BCs=bool_periodic_BCs,
+                bool_use_cuda=bool_use_cuda,
+                filter_sigma=(
+                    filter_sigma if (bool_filter and bool_last_iteration) else None
+                ),
             )
             sfield_in = sfield
-        if bool_filter:
-            sfield = utils.filter_highpass(sfield, sigma=filter_sigma)
     if bool_equalize:
         sfield = utils.rescaled_equalize(sfield)
     return sfield
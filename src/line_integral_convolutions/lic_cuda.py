@@ -0,0 +1,240 @@
+## This file is part of the "line-integral-convolutions" project.
+## Copyright (c) 2024 Neco Kriel.
+## Licensed under the MIT License. See LICENSE for details.
+
+
+## ###############################################################
+## IMPORT MODULES
+## ###############################################################
+import numpy as np
+
+from numba import cuda
+
+## ###############################################################
+## CUDA LIC IMPLEMENTATION
+## ###############################################################
+## number of threads per block along each axis of the (row, col) launch grid
+THREADS_PER_BLOCK = (16, 16)
+
+
+@cuda.jit(device=True)
+def interpolate_bilinear(
+    sfield: np.ndarray, row: float, col: float, num_rows: int, num_cols: int
+) -> float:
+    """
+    Bilinear interpolation on a 2D field with shape (num_rows, num_cols) at a non-integer position (row, col).
+    """
+    row_low = int(row)
+    col_low = int(col)
+    row_high = min(row_low + 1, num_rows - 1)
+    col_high = min(col_low + 1, num_cols - 1)
+    ## weight based on distance from pixel edge
+    weight_row_high = row - np.float32(row_low)
+    weight_col_high = col - np.float32(col_low)
+    weight_row_low = np.float32(1.0) - weight_row_high
+    weight_col_low = np.float32(1.0) - weight_col_high
+    return (
+        sfield[row_low, col_low] * weight_row_low * weight_col_low
+        + sfield[row_low, col_high] * weight_row_low * weight_col_high
+        + sfield[row_high, col_low] * weight_row_high * weight_col_low
+        + sfield[row_high, col_high] * weight_row_high * weight_col_high
+    )
+
+
+@cuda.jit(device=True)
+def advect_streamline(
+    vfield_x: np.ndarray,
+    vfield_y: np.ndarray,
+    sfield_in: np.ndarray,
+    start_row: int,
+    start_col: int,
+    dir_sgn: int,
+    bool_periodic_BCs: bool,
+    weights: np.ndarray,
+) -> tuple[float, float]:
+    """
+    Computes the intensity of a pixel (start_row, start_col) by summing the weighted contributions of pixels along a streamline stemming from it. This mirrors a single lane of `lic.advect_streamlines`.
+    """
+    zero = np.float32(0.0)
+    one = np.float32(1.0)
+    infinity = np.float32(np.inf)
+    weighted_sum = zero
+    total_weight = zero
+    row_float, col_float = np.float32(start_row), np.float32(start_col)
+    sgn_float = np.float32(dir_sgn)
+    num_rows, num_cols = vfield_x.shape
+    num_rows_float, num_cols_float = np.float32(num_rows), np.float32(num_cols)
+    for step in range(weights.shape[0]):
+        ## remember (x,y) -> (col, row)
+        vfield_comp_col = sgn_float * interpolate_bilinear(
+            vfield_x, row_float, col_float, num_rows, num_cols
+        )
+        vfield_comp_row = sgn_float * interpolate_bilinear(
+            vfield_y, row_float, col_float, num_rows, num_cols
+        )
+        sfield_value = interpolate_bilinear(
+            sfield_in, row_float, col_float, num_rows, num_cols
+        )
+        ## skip if the field magnitude is zero: advection has halted
+        if vfield_comp_row == zero and vfield_comp_col == zero:
+            break
+        ## compute how long the streamline advects before it leaves the current cell region
+        row_low = np.float32(int(row_float))
+        col_low = np.float32(int(col_float))
+        row_edge = (
+            row_low + one
+            if vfield_comp_row > zero
+            else (row_low - one if row_float == row_low else row_low)
+        )
+        col_edge = (
+            col_low + one
+            if vfield_comp_col > zero
+            else (col_low - one if col_float == col_low else col_low)
+        )
+        delta_time_row = (
+            (row_edge - row_float) / vfield_comp_row
+            if vfield_comp_row != zero
+            else infinity
+        )
+        delta_time_col = (
+            (col_edge - col_float) / vfield_comp_col
+            if vfield_comp_col != zero
+            else infinity
+        )
+        time_step = min(delta_time_col, delta_time_row)
+        ## advect the streamline to the next cell region, landing exactly on the crossed edge
+        row_float = (
+            row_edge
+            if delta_time_row == time_step
+            else row_float + vfield_comp_row * time_step
+        )
+        col_float = (
+            col_edge
+            if delta_time_col == time_step
+            else col_float + vfield_comp_col * time_step
+        )
+        if bool_periodic_BCs:
+            if row_float < zero:
+                row_float += num_rows_float
+            if row_float >= num_rows_float:
+                row_float -= num_rows_float
+            if col_float < zero:
+                col_float += num_cols_float
+            if col_float >= num_cols_float:
+                col_float -= num_cols_float
+        else:
+            ## open boundaries: terminate if streamline leaves the domain
+            if not (
+                (zero <= row_float < num_rows_float)
+                and (zero <= col_float < num_cols_float)
+            ):
+                break
+        ## weight the contribution of the current pixel based on its distance from the start of the streamline
+        contribution_weight = weights[step]
+        weighted_sum += contribution_weight * sfield_value
+        total_weight += contribution_weight
+    return weighted_sum, total_weight
+
+
+@cuda.jit(device=True)
+def _compute_lic_pixel(
+    vfield_x: np.ndarray,
+    vfield_y: np.ndarray,
+    sfield_in: np.ndarray,
+    row: int,
+    col: int,
+    bool_periodic_BCs: bool,
+    weights: np.ndarray,
+) -> float:
+    """
+    Computes the LIC of a single pixel by advecting streamlines from it in both forward and backward directions.
+    """
+    forward_sum, forward_total = advect_streamline(
+        vfield_x, vfield_y, sfield_in, row, col, 1, bool_periodic_BCs, weights
+    )
+    backward_sum, backward_total = advect_streamline(
+        vfield_x, vfield_y, sfield_in, row, col, -1, bool_periodic_BCs, weights
+    )
+    ## compare against a single-precision zero: a float64 literal would promote the test to double precision on the GPU
+    zero = np.float32(0.0)
+    total_weight = forward_total + backward_total
+    if total_weight > zero:
+        return (forward_sum + backward_sum) / total_weight
+    return zero
+
+
+## note: fast-math is left off: on CUDA it is all-or-nothing (flush-to-zero, approximate division, and assuming no
+## infs), whereas `delta_time_*` can legitimately be inf (see `lic.FASTMATH_FLAGS`)
+@cuda.jit(fastmath=False, cache=True)
+def _compute_lic_periodic(
+    vfield_x: np.ndarray,
+    vfield_y: np.ndarray,
+    sfield_in: np.ndarray,
+    weights: np.ndarray,
+    sfield_out: np.ndarray,
+) -> None:
+    """
+    CUDA kernel (one thread per pixel) specialised for periodic boundary conditions.
+    """
+    row, col = cuda.grid(2)
+    if (row < sfield_out.shape[0]) and (col < sfield_out.shape[1]):
+        sfield_out[row, col] = _compute_lic_pixel(
+            vfield_x, vfield_y, sfield_in, row, col, True, weights
+        )
+
+
+@cuda.jit(fastmath=False, cache=True)
+def _compute_lic_open(
+    vfield_x: np.ndarray,
+    vfield_y: np.ndarray,
+    sfield_in: np.ndarray,
+    weights: np.ndarray,
+    sfield_out: np.ndarray,
+) -> None:
+    """
+    CUDA kernel (one thread per pixel) specialised for open boundary conditions.
+    """
+    row, col = cuda.grid(2)
+    if (row < sfield_out.shape[0]) and (col < sfield_out.shape[1]):
+        sfield_out[row, col] = _compute_lic_pixel(
+            vfield_x, vfield_y, sfield_in, row, col, False, weights
+        )
+
+
+def compute_lic_cuda(
+    vfield_x: np.ndarray,
+    vfield_y: np.ndarray,
+    sfield_in: np.ndarray,
+    weights: np.ndarray,
+    bool_periodic_BCs: bool = True,
+) -> np.ndarray:
+    """
+    Computes the Line Integral Convolution (LIC) on a CUDA-capable GPU. Inputs are expected to be C-contiguous float32 arrays, as prepared by `lic.compute_lic`.
+
+    Returns:
+    --------
+    np.ndarray
+        A 2D array storing the output LIC image with shape (num_rows, num_cols).
+    """
+    assert cuda.is_available(), "No CUDA-capable GPU was found."
+    num_rows, num_cols = sfield_in.shape
+    num_blocks = (
+        (num_rows + THREADS_PER_BLOCK[0] - 1) // THREADS_PER_BLOCK[0],
+        (num_cols + THREADS_PER_BLOCK[1] - 1) // THREADS_PER_BLOCK[1],
+    )
+    sfield_out = cuda.device_array((num_rows, num_cols), dtype=np.float32)
+    if bool_periodic_BCs:
+        _compute_lic_kernel = _compute_lic_periodic
+    else:
+        _compute_lic_kernel = _compute_lic_open
+    _compute_lic_kernel[num_blocks, THREADS_PER_BLOCK](
+        cuda.to_device(vfield_x),
+        cuda.to_device(vfield_y),
+        cuda.to_device(sfield_in),
+        cuda.to_device(weights),
+        sfield_out,
+    )
+    return sfield_out.copy_to_host()
+
+
+## END OF CUDA LIC IMPLEMENTATION